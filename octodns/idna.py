@@ -3,6 +3,7 @@
 #
 
 from collections.abc import MutableMapping
+from functools import lru_cache
 
 from idna import IDNAError as _IDNAError
 from idna import decode as _decode
@@ -18,36 +19,53 @@ class IdnaError(Exception):
         super().__init__(str(idna_error))
 
 
+# The idna codec is slow and the same names (zones, common labels, targets) get
+# encoded and decoded over and over so the results are cached. Plain ascii
+# names are handled without the codec and aren't cached.
+
+
+@lru_cache(maxsize=4096)
+def _idna_encode(name):
+    try:
+        if name.startswith('*'):
+            # idna.encode doesn't like the *
+            name = _encode(name[2:]).decode('utf-8')
+            return f'*.{name}'
+        return _encode(name).decode('utf-8')
+    except _IDNAError as e:
+        raise IdnaError(e)
+
+
+@lru_cache(maxsize=4096)
+def _idna_decode(name):
+    try:
+        if name.startswith('*'):
+            # idna.decode doesn't like the *
+            return f'*.{_decode(name[2:])}'
+        return _decode(name)
+    except _IDNAError as e:
+        raise IdnaError(e)
+
+
 def idna_encode(name):
     # Based on https://github.com/psf/requests/pull/3695/files
     # #diff-0debbb2447ce5debf2872cb0e17b18babe3566e9d9900739e8581b355bd513f7R39
     name = name.lower()
-    try:
-        name.encode('ascii')
+    if name.isascii():
         # No utf8 chars, just use as-is
         return name
-    except UnicodeEncodeError:
-        try:
-            if name.startswith('*'):
-                # idna.encode doesn't like the *
-                name = _encode(name[2:]).decode('utf-8')
-                return f'*.{name}'
-            return _encode(name).decode('utf-8')
-        except _IDNAError as e:
-            raise IdnaError(e)
+    return _idna_encode(name)
 
 
 def idna_decode(name):
-    pieces = name.lower().split('.')
+    lowered = name.lower()
+    if 'xn--' not in lowered:
+        # can't possibly be idna, skip splitting and checking each label
+        return name
+    pieces = lowered.split('.')
     if any(p.startswith('xn--') for p in pieces):
-        try:
-            # it's idna
-            if name.startswith('*'):
-                # idna.decode doesn't like the *
-                return f'*.{_decode(name[2:])}'
-            return _decode(name)
-        except _IDNAError as e:
-            raise IdnaError(e)
+        # it's idna
+        return _idna_decode(name)
     # not idna, just return as-is
     return name
 
@@ -56,9 +74,14 @@ class IdnaDict(MutableMapping):
     '''A dict type that is insensitive to case and utf-8/idna encoded strings'''
 
     def __init__(self, data=None):
-        self._data = dict()
-        if data is not None:
-            self.update(data)
+        if data is None:
+            self._data = dict()
+            return
+        if hasattr(data, 'items'):
+            data = data.items()
+        # normalize all of the keys in a single pass rather than going through
+        # update & __setitem__ one key at a time
+        self._data = {idna_encode(k): v for k, v in data}
 
     def __setitem__(self, k, v):
         self._data[idna_encode(k)] = v
@@ -2,7 +2,6 @@
 #
 #
 
-from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from importlib import import_module
 from logging import getLogger
@@ -61,6 +60,8 @@ class _AggregateTarget(object):
 
 
 class MakeThreadFuture(object):
+    __slots__ = ('func', 'args', 'kwargs')
+
     def __init__(self, func, args, kwargs):
         self.func = func
         self.args = args
@@ -364,29 +365,25 @@ class Manager(object):
         if self._configured_sub_zones is None:
             # First time through we compute all the sub-zones
 
-            configured_sub_zones = IdnaDict()
-
-            # Get a list of all of our zone names. Sort them from shortest to
-            # longest so that parents will always come before their subzones
-            zones = sorted(
-                self.config['zones'].keys(), key=lambda z: len(z), reverse=True
-            )
-            zones = deque(zones)
-            # Until we're done processing zones
-            while zones:
-                # Grab the one we'lre going to work on now
-                zone = zones.pop()
-                dotted = f'.{zone}'
-                trimmer = len(dotted)
-                subs = set()
-                # look at all the zone names that come after it
-                for candidate in zones:
-                    # If they end with this zone's dotted name, it's a sub
-                    if candidate.endswith(dotted):
+            # Every configured zone gets an entry, even if it has no subs
+            configured_sub_zones = {z: set() for z in self.config['zones']}
+
+            # Rather than comparing every zone against every other zone we walk
+            # up through each zone's parents, e.g. for deep.thing.some.com. we
+            # check thing.some.com., some.com., and com., and add it as a sub
+            # of any of them that are configured.
+            for zone in configured_sub_zones.keys():
+                i = zone.find('.')
+                # the last char is the trailing ., nothing beyond it
+                last = len(zone) - 1
+                while 0 <= i < last:
+                    subs = configured_sub_zones.get(zone[i + 1 :])
+                    if subs is not None:
                         # We want subs to exclude the zone portion
-                        subs.add(candidate[:-trimmer])
+                        subs.add(zone[:i])
+                    i = zone.find('.', i + 1)
 
-                configured_sub_zones[zone] = subs
+            configured_sub_zones = IdnaDict(configured_sub_zones)
 
             self._configured_sub_zones = configured_sub_zones
 
@@ -2,16 +2,15 @@
 #
 #
 
-from collections import defaultdict
 from logging import getLogger
+from sys import intern
 
-from ..equality import EqualityTupleMixin
 from ..idna import IdnaError, idna_decode, idna_encode
 from .change import Update
 from .exception import RecordException, ValidationError
 
 
-class Record(EqualityTupleMixin):
+class Record(object):
     log = getLogger('Record')
 
     _CLASSES = {}
@@ -20,6 +19,7 @@ class Record(EqualityTupleMixin):
     def register_type(cls, _class, _type=None):
         if _type is None:
             _type = _class._type
+        _type = intern(_type)
         existing = cls._CLASSES.get(_type)
         if existing:
             module = existing.__module__
@@ -34,31 +34,48 @@ class Record(EqualityTupleMixin):
 
     @classmethod
     def new(cls, zone, name, data, source=None, lenient=False):
-        reasons = []
         try:
-            name = idna_encode(str(name))
+            _type = data['type']
+        except KeyError:
+            name = cls._encode_name(name, [])
+            fqdn = f'{name}.{zone.name}' if name else zone.name
+            raise Exception(f'Invalid record {idna_decode(fqdn)}, missing type')
+        try:
+            _class = cls._CLASSES[_type]
+        except KeyError:
+            raise Exception(f'Unknown record type: "{_type}"')
+        return cls._new_with_class(
+            _class, zone, name, data, source=source, lenient=lenient
+        )
+
+    @staticmethod
+    def _encode_name(name, reasons):
+        # idna encodes name, if that fails the error is added to reasons and
+        # the un-encoded name is returned
+        if not isinstance(name, str):
+            name = str(name)
+        try:
+            return idna_encode(name)
         except IdnaError as e:
             # convert the error into a reason
             reasons.append(str(e))
-            name = str(name)
+            return name
+
+    @classmethod
+    def _new_with_class(
+        cls, _class, zone, name, data, source=None, lenient=False
+    ):
+        # the guts of new for when the caller has already resolved the type's
+        # class, e.g. from_rrs
+        reasons = []
+        name = cls._encode_name(name, reasons)
 
         if ' ' in name or '\t' in name:
             reasons.append('invalid record, whitespace is not allowed')
 
         fqdn = f'{name}.{zone.name}' if name else zone.name
-        try:
-            _type = data['type']
-        except KeyError:
-            raise Exception(f'Invalid record {idna_decode(fqdn)}, missing type')
-        try:
-            _class = cls._CLASSES[_type]
-        except KeyError:
-            raise Exception(f'Unknown record type: "{_type}"')
         reasons.extend(_class.validate(name, fqdn, data))
-        try:
-            lenient |= data['octodns']['lenient']
-        except KeyError:
-            pass
+        lenient |= data.get('octodns', {}).get('lenient', False)
         if reasons:
             if lenient:
                 cls.log.warning(ValidationError.build_message(fqdn, reasons))
@@ -77,13 +94,17 @@ class Record(EqualityTupleMixin):
                 f'invalid fqdn, "{idna_decode(fqdn)}" is too long at {n} '
                 'chars, max is 253'
             )
-        for label in name.split('.'):
-            n = len(label)
-            if n > 63:
-                reasons.append(
-                    f'invalid label, "{label}" is too long at {n}'
-                    ' chars, max is 63'
-                )
+        # no label can be too long if the whole name isn't, which is by far the
+        # common case, so we can skip splitting it up
+        if len(name) > 63:
+            append = reasons.append
+            for label in name.split('.'):
+                n = len(label)
+                if n > 63:
+                    append(
+                        f'invalid label, "{label}" is too long at {n}'
+                        ' chars, max is 63'
+                    )
         # TODO: look at the idna lib for a lot more potential validations...
         try:
             ttl = int(data['ttl'])
@@ -91,34 +112,39 @@ class Record(EqualityTupleMixin):
                 reasons.append('invalid ttl')
         except KeyError:
             reasons.append('missing ttl')
-        try:
-            if data['octodns']['healthcheck']['protocol'] not in (
-                'HTTP',
-                'HTTPS',
-                'TCP',
-            ):
-                reasons.append('invalid healthcheck protocol')
-        except KeyError:
-            pass
+        healthcheck = data.get('octodns', {}).get('healthcheck', {})
+        # an explicit protocol of None is invalid so check for the key rather
+        # than the value
+        if 'protocol' in healthcheck and healthcheck['protocol'] not in (
+            'HTTP',
+            'HTTPS',
+            'TCP',
+        ):
+            reasons.append('invalid healthcheck protocol')
         return reasons
 
     @classmethod
     def from_rrs(cls, zone, rrs, lenient=False):
         # group records by name & type so that multiple rdatas can be combined
         # into a single record when needed
-        grouped = defaultdict(list)
+        grouped = {}
         for rr in rrs:
-            grouped[(rr.name, rr._type)].append(rr)
+            grouped.setdefault((rr.name, rr._type), []).append(rr)
 
         records = []
-        # walk the grouped rrs converting each one to data and then create a
-        # record with that data
-        for _, rrs in sorted(grouped.items()):
+        # lookups that are invariant across the loop below
+        classes = cls._CLASSES
+        hostname_from_fqdn = zone.hostname_from_fqdn
+        new_with_class = Record._new_with_class
+        # walk the grouped rrs, in order of name & type, converting each one to
+        # data and then create a record with that data
+        for key in sorted(grouped):
+            rrs = grouped[key]
             rr = rrs[0]
-            name = zone.hostname_from_fqdn(rr.name)
-            _class = cls._CLASSES[rr._type]
+            name = hostname_from_fqdn(rr.name)
+            _class = classes[rr._type]
             data = _class.data_from_rrs(rrs)
-            record = Record.new(zone, name, data, lenient=lenient)
+            record = new_with_class(_class, zone, name, data, lenient=lenient)
             records.append(record)
 
         return records
@@ -126,12 +152,29 @@ class Record(EqualityTupleMixin):
     def __init__(self, zone, name, data, source=None):
         self.zone = zone
         if name:
-            # internally everything is idna
-            self.name = idna_encode(str(name))
+            if not isinstance(name, str):
+                name = str(name)
+            # internally everything is idna, ascii names, which includes
+            # everything coming through Record.new, are already encoded so
+            # they just need lowering. Names are interned since the same ones
+            # repeat across records & zones and are constantly hashed and
+            # compared
+            self.name = intern(
+                name.lower() if name.isascii() else idna_encode(name)
+            )
             # we'll keep a decoded version around for logs and errors
-            self.decoded_name = idna_decode(self.name)
+            if 'xn--' in self.name:
+                self.decoded_name = intern(idna_decode(self.name))
+            else:
+                self.decoded_name = self.name
         else:
             self.name = self.decoded_name = name
+        if self.name:
+            self.fqdn = f'{self.name}.{zone.name}'
+            self.decoded_fqdn = f'{self.decoded_name}.{zone.decoded_name}'
+        else:
+            self.fqdn = zone.name
+            self.decoded_fqdn = zone.decoded_name
         self.log.debug(
             '__init__: zone.name=%s, type=%11s, name=%s',
             zone.decoded_name,
@@ -142,6 +185,11 @@ class Record(EqualityTupleMixin):
         self.ttl = int(data['ttl'])
 
         self._octodns = data.get('octodns', {})
+        self._healthcheck = self._octodns.get('healthcheck', {})
+
+        # name & _type don't change once we're constructed so the hash can be
+        # calculated once up front
+        self._hash = hash((self.name, self._type))
 
     def _data(self):
         return {'ttl': self.ttl}
@@ -150,20 +198,6 @@ class Record(EqualityTupleMixin):
     def data(self):
         return self._data()
 
-    @property
-    def fqdn(self):
-        # TODO: these should be calculated and set in __init__ rather than on
-        # each use
-        if self.name:
-            return f'{self.name}.{self.zone.name}'
-        return self.zone.name
-
-    @property
-    def decoded_fqdn(self):
-        if self.decoded_name:
-            return f'{self.decoded_name}.{self.zone.decoded_name}'
-        return self.zone.decoded_name
-
     @property
     def ignored(self):
         return self._octodns.get('ignored', False)
@@ -177,34 +211,25 @@ class Record(EqualityTupleMixin):
         return self._octodns.get('included', [])
 
     def healthcheck_host(self, value=None):
-        healthcheck = self._octodns.get('healthcheck', {})
+        healthcheck = self._healthcheck
         if healthcheck.get('protocol', None) == 'TCP':
             return None
         return healthcheck.get('host', self.fqdn[:-1]) or value
 
     @property
     def healthcheck_path(self):
-        healthcheck = self._octodns.get('healthcheck', {})
+        healthcheck = self._healthcheck
         if healthcheck.get('protocol', None) == 'TCP':
             return None
-        try:
-            return healthcheck['path']
-        except KeyError:
-            return '/_dns'
+        return healthcheck.get('path', '/_dns')
 
     @property
     def healthcheck_protocol(self):
-        try:
-            return self._octodns['healthcheck']['protocol']
-        except KeyError:
-            return 'HTTPS'
+        return self._healthcheck.get('protocol', 'HTTPS')
 
     @property
     def healthcheck_port(self):
-        try:
-            return int(self._octodns['healthcheck']['port'])
-        except KeyError:
-            return 443
+        return int(self._healthcheck.get('port', 443))
 
     def changes(self, other, target):
         # We're assuming we have the same name and type if we're being compared
@@ -216,23 +241,50 @@ class Record(EqualityTupleMixin):
         data['type'] = self._type
         data['octodns'] = self._octodns
 
-        return Record.new(
-            zone if zone else self.zone,
-            self.name,
-            data,
-            self.source,
-            lenient=True,
-        )
+        zone = zone if zone else self.zone
+        if zone.name == self.zone.name:
+            # We've already been through validation and the fqdn isn't
+            # changing so there's nothing new to find, skip straight to
+            # creating the copy
+            return self.__class__(zone, self.name, data, source=self.source)
+
+        return Record.new(zone, self.name, data, self.source, lenient=True)
 
     # NOTE: we're using __hash__ and ordering methods that consider Records
     # equivalent if they have the same name & _type. Values are ignored. This
     # is useful when computing diffs/changes.
 
     def __hash__(self):
-        return f'{self.name}:{self._type}'.__hash__()
+        return self._hash
+
+    # The comparisons below are the equivalent of comparing (name, _type)
+    # tuples, but without allocating a tuple for each side of every comparison
+
+    def __eq__(self, other):
+        return self.name == other.name and self._type == other._type
+
+    def __ne__(self, other):
+        return self.name != other.name or self._type != other._type
+
+    def __lt__(self, other):
+        if self.name != other.name:
+            return self.name < other.name
+        return self._type < other._type
+
+    def __le__(self, other):
+        if self.name != other.name:
+            return self.name < other.name
+        return self._type <= other._type
 
-    def _equality_tuple(self):
-        return (self.name, self._type)
+    def __gt__(self, other):
+        if self.name != other.name:
+            return self.name > other.name
+        return self._type > other._type
+
+    def __ge__(self, other):
+        if self.name != other.name:
+            return self.name > other.name
+        return self._type >= other._type
 
     def __repr__(self):
         # Make sure this is always overridden
@@ -255,7 +307,8 @@ class ValuesMixin(object):
         # type and TTL come from the first rr
         rr = rrs[0]
         # values come from parsing the rdata portion of all rrs
-        values = [cls._value_type.parse_rdata_text(rr.rdata) for rr in rrs]
+        parse_rdata_text = cls._value_type.parse_rdata_text
+        values = [parse_rdata_text(rr.rdata) for rr in rrs]
         return {'ttl': rr.ttl, 'type': rr._type, 'values': values}
 
     def __init__(self, zone, name, data, source=None):
@@ -264,25 +317,36 @@ class ValuesMixin(object):
             values = data['values']
         except KeyError:
             values = [data['value']]
-        self.values = sorted(self._value_type.process(values))
+        values = self._value_type.process(values)
+        # the vast majority of records have a single value, there's nothing to
+        # sort in that case
+        if not isinstance(values, list) or len(values) > 1:
+            values = sorted(values)
+        self.values = values
 
     def changes(self, other, target):
+        if self is other:
+            # nothing can have changed, skip comparing values
+            return None
         if self.values != other.values:
             return Update(self, other)
         return super().changes(other, target)
 
     def _data(self):
         ret = super()._data()
-        if len(self.values) > 1:
-            values = [getattr(v, 'data', v) for v in self.values if v]
+        values = self.values
+        n = len(values)
+        if n == 1:
+            # single value, the common case, no need to build a list
+            v = values[0]
+            if v:
+                ret['value'] = getattr(v, 'data', v)
+        elif n > 1:
+            values = [getattr(v, 'data', v) for v in values if v]
             if len(values) > 1:
                 ret['values'] = values
-            elif len(values) == 1:
+            elif values:
                 ret['value'] = values[0]
-        elif len(self.values) == 1:
-            v = self.values[0]
-            if v:
-                ret['value'] = getattr(v, 'data', v)
 
         return ret
 
@@ -325,6 +389,9 @@ class ValueMixin(object):
         self.value = self._value_type.process(data['value'])
 
     def changes(self, other, target):
+        if self is other:
+            # nothing can have changed, skip comparing value
+            return None
         if self.value != other.value:
             return Update(self, other)
         return super().changes(other, target)
@@ -2,6 +2,16 @@
 #
 #
 
+from functools import lru_cache
+
+
+# Parsing addresses is relatively expensive, especially IPv6, and the same ones
+# show up repeatedly, they're parsed once when validating and again when
+# processing, and again for every copy of a record.
+@lru_cache(maxsize=4096)
+def _normalize(address_type, value):
+    return str(address_type(value))
+
 
 class _IpValue(str):
     @classmethod
@@ -22,7 +32,7 @@ class _IpValue(str):
                 reasons.append('missing value(s)')
             else:
                 try:
-                    cls._address_type(str(value))
+                    _normalize(cls._address_type, str(value))
                 except Exception:
                     addr_name = cls._address_name
                     reasons.append(f'invalid {addr_name} address "{value}"')
@@ -38,7 +48,7 @@ class _IpValue(str):
         return [cls(v) if v != '' else '' for v in values]
 
     def __new__(cls, v):
-        v = str(cls._address_type(v))
+        v = _normalize(cls._address_type, v)
         return super().__new__(cls, v)
 
     @property
@@ -2,6 +2,8 @@
 #
 #
 
+from sys import intern
+
 from .exception import RecordException
 
 
@@ -18,8 +20,10 @@ class Rr(object):
     '''
 
     def __init__(self, name, _type, ttl, rdata):
-        self.name = name
-        self._type = _type
+        # names and types repeat across lots of rrs and are used as grouping
+        # keys in Record.from_rrs
+        self.name = intern(name)
+        self._type = intern(_type)
         self.ttl = ttl
         self.rdata = rdata
 
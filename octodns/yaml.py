@@ -3,10 +3,17 @@
 #
 
 from natsort import natsort_keygen
-from yaml import SafeDumper, SafeLoader, dump, load
+from yaml import SafeDumper, dump, load
 from yaml.constructor import ConstructorError
 from yaml.representer import SafeRepresenter
 
+# Use the libyaml backed parser when PyYAML was built with it, it's several
+# times faster than the pure python one
+try:  # pragma: no cover
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover
+    from yaml import SafeLoader
+
 _natsort_key = natsort_keygen()
 
 
@@ -5,6 +5,7 @@
 import re
 from collections import defaultdict
 from logging import getLogger
+from sys import intern
 
 from .idna import idna_decode, idna_encode
 from .record import Create, Delete
@@ -31,10 +32,11 @@ class Zone(object):
         elif ' ' in name or '\t' in name:
             raise Exception(f'Invalid zone name {name}, whitespace not allowed')
 
-        # internally everything is idna
-        self.name = idna_encode(str(name)) if name else name
+        # internally everything is idna, interned since every record in the
+        # zone refers to it
+        self.name = intern(idna_encode(str(name))) if name else name
         # we'll keep a decoded version around for logs and errors
-        self.decoded_name = idna_decode(self.name)
+        self.decoded_name = intern(idna_decode(self.name))
         self.sub_zones = sub_zones
         # We're grouping by node, it allows us to efficiently search for
         # duplicates and detect when CNAMEs co-exist with other records. Also
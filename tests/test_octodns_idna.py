@@ -24,6 +24,9 @@ class TestIdna(TestCase):
         # wildcard noop
         self.assertIdna('*.unit.tests.', '*.unit.tests.')
 
+        # xn-- that isn't at the start of a label is not idna
+        self.assertIdna('notxn--idna.unit.tests.', 'notxn--idna.unit.tests.')
+
     def test_unicode(self):
         # encoded
         self.assertIdna('zajęzyk.pl.', 'xn--zajzyk-y4a.pl.')
@@ -135,6 +138,18 @@ class TestIdnaDict(TestCase):
             (self.plain, self.almost, self.utf8), tuple(d.decoded_keys())
         )
 
+    def test_init(self):
+        # mappings and iterables of pairs are both accepted and normalized
+        expected = {
+            self.plain: 42,
+            idna_encode(self.almost): 43,
+            idna_encode(self.utf8): 44,
+        }
+        self.assertEqual(expected, dict(IdnaDict(self.normal)))
+        self.assertEqual(expected, dict(IdnaDict(self.normal.items())))
+        self.assertEqual(expected, dict(IdnaDict(IdnaDict(self.normal))))
+        self.assertEqual({}, dict(IdnaDict()))
+
     def test_items(self):
         d = IdnaDict(self.normal)
 
@@ -5,7 +5,7 @@
 from os import environ
 from os.path import dirname, isfile, join
 from unittest import TestCase
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 from helpers import (
     DynamicProvider,
@@ -37,68 +37,40 @@ def get_config_filename(which):
 
 
 class TestManager(TestCase):
-    def test_missing_provider_class(self):
-        with self.assertRaises(ManagerException) as ctx:
-            Manager(get_config_filename('missing-provider-class.yaml')).sync()
-        self.assertTrue('missing class' in str(ctx.exception))
-
-    def test_bad_provider_class(self):
-        with self.assertRaises(ManagerException) as ctx:
-            Manager(get_config_filename('bad-provider-class.yaml')).sync()
-        self.assertTrue('Unknown provider class' in str(ctx.exception))
-
-    def test_bad_provider_class_module(self):
-        with self.assertRaises(ManagerException) as ctx:
-            Manager(
-                get_config_filename('bad-provider-class-module.yaml')
-            ).sync()
-        self.assertTrue('Unknown provider class' in str(ctx.exception))
-
-    def test_bad_provider_class_no_module(self):
-        with self.assertRaises(ManagerException) as ctx:
-            Manager(
-                get_config_filename('bad-provider-class-no-module.yaml')
-            ).sync()
-        self.assertTrue('Unknown provider class' in str(ctx.exception))
-
-    def test_missing_provider_config(self):
-        # Missing provider config
-        with self.assertRaises(ManagerException) as ctx:
-            Manager(get_config_filename('missing-provider-config.yaml')).sync()
-        self.assertTrue('provider config' in str(ctx.exception))
-
-    def test_missing_env_config(self):
-        with self.assertRaises(ManagerException) as ctx:
-            Manager(get_config_filename('missing-provider-env.yaml')).sync()
-        self.assertTrue('missing env var' in str(ctx.exception))
-
-    def test_missing_source(self):
-        with self.assertRaises(ManagerException) as ctx:
-            Manager(get_config_filename('provider-problems.yaml')).sync(
-                ['missing.sources.']
-            )
-        self.assertTrue('missing sources' in str(ctx.exception))
-
-    def test_missing_targets(self):
-        with self.assertRaises(ManagerException) as ctx:
-            Manager(get_config_filename('provider-problems.yaml')).sync(
-                ['missing.targets.']
-            )
-        self.assertTrue('missing targets' in str(ctx.exception))
-
-    def test_unknown_source(self):
-        with self.assertRaises(ManagerException) as ctx:
-            Manager(get_config_filename('provider-problems.yaml')).sync(
-                ['unknown.source.']
-            )
-        self.assertTrue('unknown source' in str(ctx.exception))
-
-    def test_unknown_target(self):
-        with self.assertRaises(ManagerException) as ctx:
-            Manager(get_config_filename('provider-problems.yaml')).sync(
-                ['unknown.target.']
-            )
-        self.assertTrue('unknown target' in str(ctx.exception))
+    zone = Zone('unit.tests.', [])
+
+    def setUp(self):
+        # simple.yaml, and several of the other configs, pull their yaml
+        # provider directories from the environment. Make sure those are always
+        # set so that tests which build a manager without a TemporaryDirectory
+        # of their own don't depend on whatever an earlier test left behind
+        tmpdir = TemporaryDirectory()
+        tmpdir.__enter__()
+        self.addCleanup(tmpdir.__exit__)
+        environ['YAML_TMP_DIR'] = tmpdir.dirname
+        environ['YAML_TMP_DIR2'] = tmpdir.dirname
+
+    def test_config_problems(self):
+        for filename, eligible_zones, expected in (
+            ('missing-provider-class.yaml', [], 'missing class'),
+            ('bad-provider-class.yaml', [], 'Unknown provider class'),
+            ('bad-provider-class-module.yaml', [], 'Unknown provider class'),
+            ('bad-provider-class-no-module.yaml', [], 'Unknown provider class'),
+            ('missing-provider-config.yaml', [], 'provider config'),
+            ('missing-provider-env.yaml', [], 'missing env var'),
+            ('provider-problems.yaml', ['missing.sources.'], 'missing sources'),
+            ('provider-problems.yaml', ['missing.targets.'], 'missing targets'),
+            ('provider-problems.yaml', ['unknown.source.'], 'unknown source'),
+            ('provider-problems.yaml', ['unknown.target.'], 'unknown target'),
+            (
+                'provider-problems.yaml',
+                ['not.targetable.'],
+                'does not support targeting',
+            ),
+        ):
+            with self.assertRaises(ManagerException, msg=filename) as ctx:
+                Manager(get_config_filename(filename)).sync(eligible_zones)
+            self.assertTrue(expected in str(ctx.exception), str(ctx.exception))
 
     def test_bad_plan_output_class(self):
         with self.assertRaises(ManagerException) as ctx:
@@ -113,13 +85,6 @@ class TestManager(TestCase):
             'Incorrect plan_output config for bad', str(ctx.exception)
         )
 
-    def test_source_only_as_a_target(self):
-        with self.assertRaises(ManagerException) as ctx:
-            Manager(get_config_filename('provider-problems.yaml')).sync(
-                ['not.targetable.']
-            )
-        self.assertTrue('does not support targeting' in str(ctx.exception))
-
     def test_always_dry_run(self):
         with TemporaryDirectory() as tmpdir:
             environ['YAML_TMP_DIR'] = tmpdir.dirname
@@ -134,31 +99,29 @@ class TestManager(TestCase):
         with TemporaryDirectory() as tmpdir:
             environ['YAML_TMP_DIR'] = tmpdir.dirname
             environ['YAML_TMP_DIR2'] = tmpdir.dirname
-            tc = Manager(get_config_filename('simple.yaml')).sync(dry_run=False)
+            # sync can be called repeatedly so a single manager covers all of
+            # the runs that don't need different constructor args
+            manager = Manager(get_config_filename('simple.yaml'))
+
+            tc = manager.sync(dry_run=False)
             self.assertEqual(28, tc)
 
             # try with just one of the zones
-            tc = Manager(get_config_filename('simple.yaml')).sync(
-                dry_run=False, eligible_zones=['unit.tests.']
-            )
+            tc = manager.sync(dry_run=False, eligible_zones=['unit.tests.'])
             self.assertEqual(22, tc)
 
             # the subzone, with 2 targets
-            tc = Manager(get_config_filename('simple.yaml')).sync(
+            tc = manager.sync(
                 dry_run=False, eligible_zones=['subzone.unit.tests.']
             )
             self.assertEqual(6, tc)
 
             # and finally the empty zone
-            tc = Manager(get_config_filename('simple.yaml')).sync(
-                dry_run=False, eligible_zones=['empty.']
-            )
+            tc = manager.sync(dry_run=False, eligible_zones=['empty.'])
             self.assertEqual(0, tc)
 
             # Again with force
-            tc = Manager(get_config_filename('simple.yaml')).sync(
-                dry_run=False, force=True
-            )
+            tc = manager.sync(dry_run=False, force=True)
             self.assertEqual(28, tc)
 
             # Again with max_workers = 1
@@ -186,35 +149,14 @@ class TestManager(TestCase):
             {'déjà.vu.': {}, 'deja.vu.': {}, idna_encode('こんにちは.jp.'): {}}
         )
 
-        # refer to them with utf-8
-        with self.assertRaises(ManagerException) as ctx:
-            manager.sync(eligible_zones=('déjà.vu.',))
-        self.assertEqual('Zone déjà.vu. is missing sources', str(ctx.exception))
-
-        with self.assertRaises(ManagerException) as ctx:
-            manager.sync(eligible_zones=('deja.vu.',))
-        self.assertEqual('Zone deja.vu. is missing sources', str(ctx.exception))
-
-        with self.assertRaises(ManagerException) as ctx:
-            manager.sync(eligible_zones=('こんにちは.jp.',))
-        self.assertEqual(
-            'Zone こんにちは.jp. is missing sources', str(ctx.exception)
-        )
-
-        # refer to them with idna (exceptions are still utf-8
-        with self.assertRaises(ManagerException) as ctx:
-            manager.sync(eligible_zones=(idna_encode('déjà.vu.'),))
-        self.assertEqual('Zone déjà.vu. is missing sources', str(ctx.exception))
-
-        with self.assertRaises(ManagerException) as ctx:
-            manager.sync(eligible_zones=(idna_encode('deja.vu.'),))
-        self.assertEqual('Zone deja.vu. is missing sources', str(ctx.exception))
-
-        with self.assertRaises(ManagerException) as ctx:
-            manager.sync(eligible_zones=(idna_encode('こんにちは.jp.'),))
-        self.assertEqual(
-            'Zone こんにちは.jp. is missing sources', str(ctx.exception)
-        )
+        for decoded in ('déjà.vu.', 'deja.vu.', 'こんにちは.jp.'):
+            # refer to them with utf-8 and idna, exceptions are always utf-8
+            for name in (decoded, idna_encode(decoded)):
+                with self.assertRaises(ManagerException) as ctx:
+                    manager.sync(eligible_zones=(name,))
+                self.assertEqual(
+                    f'Zone {decoded} is missing sources', str(ctx.exception)
+                )
 
     def test_eligible_sources(self):
         with TemporaryDirectory() as tmpdir:
@@ -337,9 +279,8 @@ class TestManager(TestCase):
         self.assertFalse(_AggregateTarget([dynamic, simple]).SUPPORTS_DYNAMIC)
         self.assertTrue(_AggregateTarget([dynamic, dynamic]).SUPPORTS_DYNAMIC)
 
-        zone = Zone('unit.tests.', [])
         record = Record.new(
-            zone,
+            self.zone,
             'sshfp',
             {
                 'ttl': 60,
@@ -552,16 +493,16 @@ class TestManager(TestCase):
         self.assertTrue('unknown processor' in str(ctx.exception))
 
     def test_get_zone(self):
-        Manager(get_config_filename('simple.yaml')).get_zone('unit.tests.')
+        manager = Manager(get_config_filename('simple.yaml'))
+
+        manager.get_zone('unit.tests.')
 
         with self.assertRaises(ManagerException) as ctx:
-            Manager(get_config_filename('simple.yaml')).get_zone('unit.tests')
+            manager.get_zone('unit.tests')
         self.assertTrue('missing ending dot' in str(ctx.exception))
 
         with self.assertRaises(ManagerException) as ctx:
-            Manager(get_config_filename('simple.yaml')).get_zone(
-                'unknown-zone.tests.'
-            )
+            manager.get_zone('unknown-zone.tests.')
         self.assertTrue('Unknown zone name' in str(ctx.exception))
 
     def test_populate_lenient_fallback(self):
@@ -612,22 +553,25 @@ class TestManager(TestCase):
 
     @patch('octodns.manager.Manager._get_named_class')
     def test_sync_passes_file_handle(self, mock):
-        plan_output_mock = MagicMock()
-        plan_output_class_mock = MagicMock()
-        plan_output_class_mock.return_value = plan_output_mock
-        mock.return_value = (plan_output_class_mock, 'ignored', 'ignored')
-        fh_mock = MagicMock()
+        class PlanOutputStub(object):
+            def __init__(self, name):
+                self.run_kwargs = None
 
-        Manager(get_config_filename('plan-output-filehandle.yaml')).sync(
-            plan_output_fh=fh_mock
-        )
+            def run(self, **kwargs):
+                self.run_kwargs = kwargs
+
+        mock.return_value = (PlanOutputStub, 'ignored', 'ignored')
+        fh = object()
+
+        manager = Manager(get_config_filename('plan-output-filehandle.yaml'))
+        manager.sync(plan_output_fh=fh)
 
         # Since we only care about the fh kwarg, and different _PlanOutputs are
         # are free to require arbitrary kwargs anyway, we concern ourselves
         # with checking the value of fh only.
-        plan_output_mock.run.assert_called()
-        _, kwargs = plan_output_mock.run.call_args
-        self.assertEqual(fh_mock, kwargs.get('fh'))
+        plan_output = manager.plan_outputs['doesntexist']
+        self.assertIsNotNone(plan_output.run_kwargs)
+        self.assertEqual(fh, plan_output.run_kwargs.get('fh'))
 
     def test_processor_config(self):
         # Smoke test loading a valid config
@@ -668,9 +612,8 @@ class TestManager(TestCase):
 
         targets = [PlannableProvider('prov')]
 
-        zone = Zone('unit.tests.', [])
         record = Record.new(
-            zone, 'a', {'ttl': 30, 'type': 'A', 'value': '1.2.3.4'}
+            self.zone, 'a', {'ttl': 30, 'type': 'A', 'value': '1.2.3.4'}
         )
 
         # muck with sources
@@ -57,6 +57,14 @@ class TestRecord(TestCase):
         )
         self.assertEqual('mixedcase', record.name)
 
+    def test_non_str_name(self):
+        record = ARecord(
+            self.zone, 42, {'ttl': 30, 'type': 'A', 'value': '1.2.3.4'}
+        )
+        self.assertEqual('42', record.name)
+        self.assertEqual('42.unit.tests.', record.fqdn)
+        self.assertEqual('42.unit.tests.', record.decoded_fqdn)
+
     def test_utf8(self):
         zone = Zone('natación.mx.', [])
         utf8 = 'niño'
@@ -66,8 +74,8 @@ class TestRecord(TestCase):
         )
         self.assertEqual(encoded, record.name)
         self.assertEqual(utf8, record.decoded_name)
-        self.assertTrue(f'{encoded}.{zone.name}', record.fqdn)
-        self.assertTrue(f'{utf8}.{zone.decoded_name}', record.decoded_fqdn)
+        self.assertEqual(f'{encoded}.{zone.name}', record.fqdn)
+        self.assertEqual(f'{utf8}.{zone.decoded_name}', record.decoded_fqdn)
 
     def test_utf8_values(self):
         zone = Zone('unit.tests.', [])
@@ -226,6 +234,12 @@ class TestRecord(TestCase):
             Record.new(self.zone, 'unknown', {})
         self.assertTrue('missing type' in str(ctx.exception))
 
+        # Missing type with a name that can't be idna encoded, still gets the
+        # missing type error
+        with self.assertRaises(Exception) as ctx:
+            Record.new(self.zone, 'Ã' * 60, {})
+        self.assertTrue('missing type' in str(ctx.exception))
+
         # Unknown type
         with self.assertRaises(Exception) as ctx:
             Record.new(self.zone, 'unknown', {'type': 'XXX'})
@@ -253,6 +267,21 @@ class TestRecord(TestCase):
         self.assertEqual('A', c._type)
         self.assertEqual(['1.2.3.4'], c.values)
 
+        # Copying an invalid, lenient, record works in the same zone, where
+        # validation is skipped, and in another zone, where it's lenient
+        e = Record.new(
+            self.zone,
+            'e',
+            {'ttl': -1, 'type': 'A', 'value': '1.2.3.4'},
+            lenient=True,
+        )
+        f = e.copy()
+        self.assertIsInstance(f, ARecord)
+        self.assertEqual(e.data, f.data)
+        f = e.copy(c_zone)
+        self.assertEqual('other.tests.', f.zone.name)
+        self.assertEqual(e.data, f.data)
+
         # Record with no record type specified in data.
         d_data = {'ttl': 600, 'values': ['just a test']}
         d = TxtRecord(self.zone, 'txt', d_data)
@@ -369,6 +398,14 @@ class TestRecord(TestCase):
         self.assertTrue(aaaa <= c)
         self.assertTrue(aaaa <= aaaa)
 
+        # hashing only considers name & type, values are ignored
+        other = Record.new(
+            self.zone, 'a', {'ttl': 42, 'type': 'A', 'value': '2.3.4.5'}
+        )
+        self.assertEqual(hash(a), hash(other))
+        self.assertNotEqual(hash(a), hash(aaaa))
+        self.assertEqual({a, b, c, aaaa}, {a, b, c, aaaa, other})
+
     def test_rr(self):
         # nothing much to test, just make sure that things don't blow up
         Rr('name', 'type', 42, 'Hello World!').__repr__()
@@ -468,6 +505,12 @@ class TestRecordValidation(TestCase):
             reason.endswith('xxx" is too long at 64 chars, max is 63')
         )
 
+        # a single label right at the max is fine
+        name = 'x' * 63
+        Record.new(
+            self.zone, name, {'ttl': 300, 'type': 'A', 'value': '1.2.3.4'}
+        )
+
         # should not raise with dots
         name = 'xxxxxxxx.' * 10
         Record.new(
@@ -1045,6 +1045,26 @@ class TestRecordDynamic(TestCase):
             Record.new(self.zone, 'bad', a_data)
         self.assertIn('invalid status', ctx.exception.reasons[0])
 
+        # valid statuses
+        for status in ('up', 'down', 'obey'):
+            a_data = {
+                'dynamic': {
+                    'pools': {
+                        'one': {
+                            'values': [{'value': '2.2.2.2', 'status': status}]
+                        }
+                    },
+                    'rules': [{'pool': 'one'}],
+                },
+                'ttl': 60,
+                'type': 'A',
+                'values': ['1.1.1.1'],
+            }
+            a = Record.new(self.zone, 'good', a_data)
+            self.assertEqual(
+                status, a.dynamic.pools['one'].data['values'][0]['status']
+            )
+
     def test_dynamic_lenient(self):
         # Missing pools
         a_data = {
@@ -287,3 +287,20 @@ class TestRecordGeoCodes(TestCase):
         self.assertEqual(
             ['invalid healthcheck protocol'], ctx.exception.reasons
         )
+
+        # explicitly null healthcheck protocol
+        with self.assertRaises(ValidationError) as ctx:
+            Record.new(
+                self.zone,
+                'a',
+                {
+                    'geo': {'NA': ['1.2.3.5'], 'NA-US': ['1.2.3.5', '1.2.3.6']},
+                    'type': 'A',
+                    'ttl': 600,
+                    'value': '1.2.3.4',
+                    'octodns': {'healthcheck': {'protocol': None}},
+                },
+            )
+        self.assertEqual(
+            ['invalid healthcheck protocol'], ctx.exception.reasons
+        )